@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+import timeit
+from optio import *
+
+
+def is_positive(value: int) -> bool:
+    return value > 0
+
+
+def comprehensions(params: list[str]) -> list[int]:
+    values = [ int(param) for param in [ param.strip() for param in params ] ]
+
+    for value in values:
+        if not is_positive(value):
+            raise ValueError('Parameter ' + str(value) + ' rejected by is_positive.')
+
+    return list(dict.fromkeys(values))
+
+
+pipeline = convert(str.strip) | convert(int) | check(is_positive) | unique()
+number = 1000
+
+print('params   pipeline, us   comprehensions, us')
+
+for count in [ 1, 10, 100, 1000 ]:
+    params = [ ' ' + str(i % 50 + 1) + ' ' for i in range(count) ]
+    seconds = [ min(timeit.repeat(lambda: func(params), number=number, repeat=5)) for func in [ pipeline, comprehensions ] ]
+    print('{:>6} {:>14.2f} {:>20.2f}'.format(count, seconds[0] / number * 1e6, seconds[1] / number * 1e6))
+
+'''
+Pipeline is convert(strip) | convert(int) | check(is_positive) | unique(),
+comprehensions do the same in several passes over intermediate lists.
+
+Possible output:
+
+params   pipeline, us   comprehensions, us
+     1           0.81                 1.09
+    10           3.16                 3.40
+   100          25.74                28.65
+  1000         241.59               254.42
+'''
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+import timeit
+from optio import *
+
+
+def build(options: int) -> OptioParser:
+    parser = OptioParser()\
+        .add_option({'-c'}, count=(1, 1))\
+        .add_option({'-f', '--file'})
+
+    for i in range(options - 2):
+        parser.add_option({'--option' + str(i)}, required=False)
+
+    return parser
+
+
+args = [ '-c', '1', '--file', '1.txt', '2.txt' ]
+number = 10000
+
+print('options   parse, us')
+
+for options in [ 2, 30, 300, 3000 ]:
+    parser = build(options)
+    seconds = timeit.timeit(lambda: parser.parse(args), number=number)
+    print('{:>7} {:>11.2f}'.format(options, seconds / number * 1e6))
+
+'''
+Possible output:
+
+options   parse, us
+      2       16.57
+     30       18.41
+    300       22.69
+   3000       19.23
+'''
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+import sys
+from optio import *
+
+
+# accepted values are sent to clients as JSON, hence only plain values are produced
+
+def accept_ints(params: list[str]) -> list[int]:
+    return [ int(p) for p in params ]
+
+
+def accept_join(params: list[str]) -> str:
+    return '/'.join(params)
+
+
+parser = OptioParser()\
+    .add_option(views={'-c', '--copy'}, acceptor=accept_ints, count=(1, None), required=True, short_info='', long_info='')\
+    .add_option(views={'-p', '--path'}, acceptor=accept_join, count=(1, None), required=True, short_info='', long_info='')\
+    .add_option(views={'-f', '--file'},                       count=(1, None), required=True, short_info='', long_info='')\
+    .add_option(views={'-k', '--kind'},                       count=(1,    1), required=True, short_info='', long_info='')
+
+
+if __name__ == '__main__':
+    from optio.client import OptioClient
+
+    # python3 -m optio.server /tmp/optio.sock printer=examples.daemon:parser
+    # python3 -m examples.daemon -c1 2 --file=1.txt 2.txt -p ~ path to folder --kind=xerox -- -a
+
+    client = OptioClient('/tmp/optio.sock', fallback=lambda name: parser)
+    result = client.parse('printer', sys.argv[1:])
+    client.close()
+
+    print(result.value('-c'))
+    print(result.value('-p'))
+    print(result.value('-f'))
+    print(result.value('-k'))
+    print(result.plain_args())
+
+'''
+Possible output:
+
+[1, 2]
+~/path/to/folder
+['1.txt', '2.txt']
+['xerox']
+['-a']
+'''
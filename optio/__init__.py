@@ -1 +1,21 @@
-from .parser import *
+# parser and acceptors are imported upon first use, so that optio.client
+# could be imported by short-lived processes without them
+
+__all__ = [
+    'OptioLimitError', 'OptioResult', 'OptioParser',
+    'OptioPipeline', 'convert', 'check', 'unique', 'collect', 'decode'
+]
+
+
+def __getattr__(name: str) -> any:
+
+    if name not in __all__:
+        raise AttributeError('module ' + __name__ + ' has no attribute ' + name)
+
+    from . import acceptor, parser
+
+    for module in [ parser, acceptor ]:
+        for export in module.__all__:
+            globals()[export] = getattr(module, export)
+
+    return globals()[name]
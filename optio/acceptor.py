@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+
+
+__all__ = ['OptioPipeline', 'convert', 'check', 'unique', 'collect', 'decode']
+
+
+_CONVERT = 'convert'
+_CHECK = 'check'
+_UNIQUE = 'unique'
+
+
+def _name(func: function) -> str:
+    return getattr(func, '__name__', None) or str(func)
+
+
+def _verify(func: function) -> function:
+
+    if not callable(func):
+        raise ValueError('Step shall be any callable, e.g. function or functor.')
+
+    return func
+
+
+def _reject(param: any, predicate: function) -> None:
+    raise ValueError('Parameter ' + str(param) + ' rejected by ' + _name(predicate) + '.')
+
+
+def _compile(steps: tuple) -> function:
+
+    # steps are unrolled into the body of a single loop, so that parameters pass
+    # all of them in one go without dispatching on kinds of steps
+
+    namespace = { '_reject': _reject }
+    head = [ 'result = []', 'append = result.append' ]
+    body = []
+
+    for i, (kind, func) in enumerate(steps):
+        name = 'step' + str(i)
+
+        if kind is _CONVERT:
+            namespace[name] = func
+            body.append('param = ' + name + '(param)')
+
+        elif kind is _CHECK:
+            namespace[name] = func
+            body.append('if not ' + name + '(param): _reject(param, ' + name + ')')
+
+        else:
+            head.append(name + ' = set()')
+            head.append('add' + str(i) + ' = ' + name + '.add')
+            body.append('if param in ' + name + ': continue')
+            body.append('add' + str(i) + '(param)')
+
+    body.append('append(param)')
+
+    source = 'def run(params):\n' + \
+        ''.join([ '    ' + line + '\n' for line in head ]) + \
+        '    for param in params:\n' + \
+        ''.join([ '        ' + line + '\n' for line in body ]) + \
+        '    return result\n'
+
+    exec(source, namespace)
+
+    return namespace['run']
+
+
+class OptioPipeline:
+
+    def __init__(self, steps: tuple = (), collector: function | None = None) -> OptioPipeline:
+        self.__steps = steps
+        self.__collector = collector
+        self.__run = _compile(steps)
+
+    def __str__(self) -> str:
+        names = [ kind + '(' + ('' if func == None else _name(func)) + ')' for kind, func in self.__steps ]
+
+        if self.__collector != None:
+            names.append('collect(' + _name(self.__collector) + ')')
+
+        return ' | '.join(names)
+
+    def __or__(self, other: OptioPipeline) -> OptioPipeline:
+
+        if not isinstance(other, OptioPipeline):
+            return NotImplemented
+
+        if self.__collector != None:
+            raise ValueError('Pipeline ' + str(self) + ' is already collected.')
+
+        return OptioPipeline(self.__steps + other.steps(), other.collector())
+
+    def steps(self) -> tuple:
+        return self.__steps
+
+    def collector(self) -> function | None:
+        return self.__collector
+
+    def __call__(self, params: list[str] | None) -> any:
+
+        # options that are not found have no parameters to accept
+
+        if params == None:
+            return None
+
+        result = self.__run(params)
+
+        return result if self.__collector == None else self.__collector(result)
+
+
+def convert(func: function) -> OptioPipeline:
+    return OptioPipeline(((_CONVERT, _verify(func)),))
+
+
+def check(predicate: function) -> OptioPipeline:
+    return OptioPipeline(((_CHECK, _verify(predicate)),))
+
+
+def unique() -> OptioPipeline:
+    return OptioPipeline(((_UNIQUE, None),))
+
+
+def collect(func: function) -> OptioPipeline:
+    return OptioPipeline((), _verify(func))
+
+
+def decode(encoding: str = 'utf-8', errors: str = 'strict') -> OptioPipeline:
+
+    def decode(param: str | memoryview) -> str:
+        return param if isinstance(param, str) else str(param, encoding, errors)
+
+    return convert(decode)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+import json
+import socket
+from .result import OptioResult
+
+
+# the client is used by short-lived processes, hence it relies on the standard
+# library only and the parser is imported by the fallback, if ever
+
+# errors transferred over the wire, anything else is reported as RuntimeError
+
+_ERRORS = { 'ValueError': ValueError, 'RuntimeError': RuntimeError, 'TypeError': TypeError }
+
+
+def _encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def _decode(line: bytes) -> dict:
+    return json.loads(line.decode('utf-8'))
+
+
+class OptioClient:
+
+    def __init__(self, path: str, fallback: function | None = None, timeout: float = 1.0) -> OptioClient:
+
+        if fallback != None and not callable(fallback):
+            raise ValueError('Fallback shall be any callable, e.g. function or functor.')
+
+        self.__path = path
+        self.__fallback = fallback
+        self.__timeout = timeout
+        self.__socket = None
+        self.__stream = None
+        self.__parsers = dict()
+
+    def __connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            sock.settimeout(self.__timeout)
+            sock.connect(self.__path)
+
+        except OSError:
+            sock.close()
+            raise
+
+        self.__socket = sock
+        self.__stream = sock.makefile('rwb')
+
+    def __request(self, message: dict) -> dict:
+
+        # reconnect once, the daemon may have been restarted since the last request
+
+        for attempt in range(2):
+            try:
+                if self.__socket == None:
+                    self.__connect()
+
+                self.__stream.write(_encode(message))
+                self.__stream.flush()
+                line = self.__stream.readline()
+
+                if line:
+                    return _decode(line)
+
+                raise ConnectionError('Connection closed by ' + self.__path + '.')
+
+            except OSError:
+                self.close()
+
+                if attempt > 0:
+                    raise
+
+    def __parse_locally(self, name: str, args: list[str] | str, conflicts: list[set[str]]) -> OptioResult:
+
+        if name not in self.__parsers:
+            self.__parsers[name] = self.__fallback(name)
+
+        return self.__parsers[name].parse(args, conflicts).result()
+
+    def close(self) -> None:
+
+        if self.__stream != None:
+            self.__stream.close()
+
+        if self.__socket != None:
+            self.__socket.close()
+
+        self.__socket = None
+        self.__stream = None
+
+    def parse(self, name: str, args: list[str] | str, conflicts: list[set[str]] = []) -> OptioResult:
+
+        # bytes-like input is not representable in JSON, it is rejected before the fallback is considered
+
+        for arg in [ args ] if isinstance(args, str) else args:
+            if not isinstance(arg, str):
+                raise ValueError('Argument ' + str(arg) + ' is not a string, only strings are sent to the daemon.')
+
+        message = { 'parser': name, 'args': args, 'conflicts': [ sorted(conflict) for conflict in conflicts ] }
+
+        try:
+            reply = self.__request(message)
+
+        except OSError:
+            if self.__fallback == None:
+                raise
+
+            return self.__parse_locally(name, args, conflicts)
+
+        if 'error' in reply:
+            raise _ERRORS.get(reply['error'], RuntimeError)(reply['message'])
+
+        return OptioResult(reply['values'], reply['plain_args'])
@@ -2,10 +2,25 @@
 
 
 from __future__ import annotations
-from collections import deque
-import itertools
+from collections import deque, OrderedDict
 import re
 import sys
+import time
+from .result import OptioResult
+
+
+__all__ = ['OptioLimitError', 'OptioResult', 'OptioParser']
+
+
+_SPACES = re.compile(r'[ \r\t\n]+')
+_TOKEN = re.compile(r'[^ \r\t\n]+')
+_BYTES_TOKEN = re.compile(rb'[^\0 \r\t\n]+')
+
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
+class OptioLimitError(RuntimeError):
+    pass
 
 
 class _Option:
@@ -113,6 +128,9 @@ class _Option:
     def long_info(self) -> str:
         return self.__long_info
 
+    def count(self) -> tuple[int, int]:
+        return self.__count
+
     def is_flag(self) -> bool:
         return self.__count == (0, 0)
 
@@ -122,15 +140,17 @@ class _Option:
     def is_found(self) -> bool:
         return self.__found
 
-    def gather(self, args: deque) -> _Option:
+    def gather(self, args: deque, limit: int = sys.maxsize) -> _Option:
 
         self.__found = True
         if self.__value == None: self.__value = []
 
-        while args and len(self.__value) < self.__count[1]:
+        limit = min(limit, self.__count[1])
+
+        while args and len(self.__value) < limit:
             arg = args.popleft()
 
-            if arg.startswith('-'):
+            if isinstance(arg, str) and arg.startswith('-'):
                 args.appendleft(arg)
                 break
 
@@ -153,6 +173,11 @@ class _Option:
         self.__value = self.__acceptor(self.__value)
         return self
 
+    def assign(self, value: list[str]) -> _Option:
+        self.__value = value
+        self.__found = True
+        return self
+
     def reset(self) -> _Option:
         self.__value = None
         self.__found = False
@@ -163,8 +188,20 @@ class OptioParser:
 
     def __init__(self) -> OptioParser:
         self.__options = []
+        self.__required = []
+        self.__found = []
         self.__plain_args = []
         self.__view2option = dict()
+        self.__encoded = { b'--': '--' }
+        self.__plans = None
+
+        # scratch buffers reused by every parse
+
+        self.__tokens = []
+        self.__args = deque()
+        self.__delimited = False
+
+        self.limit()
 
     def __str__(self) -> str:
         return 'Parser [' + ', '.join(list(map(str, self.__options))) + ']'
@@ -185,11 +222,78 @@ class OptioParser:
             if view in self.__view2option:
                 raise RuntimeError('View ' + str(view) + ' conflicts with ' + str(self.__view2option[view]) + '.')
             self.__view2option[view] = option
+            self.__encoded[view.encode('utf-8')] = view
 
         self.__options.append(option)
+        self.__clear_plans()
+
+        if option.is_required():
+            self.__required.append(option)
 
         return self
 
+    def limit(self, input_length: int | None = None, tokens: int | None = None,
+        option_params: int | None = None, params: int | None = None,
+        timeout: float | None = None) -> OptioParser:
+
+        limits = [ input_length, tokens, option_params, params ]
+
+        for limit in limits:
+            if limit != None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 0):
+                raise ValueError('Limit ' + str(limit) + ' is malformed.')
+
+        if timeout != None and (not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0):
+            raise ValueError('Timeout ' + str(timeout) + ' is malformed.')
+
+        self.__max_input_length, self.__max_tokens, self.__max_option_params, self.__max_params = \
+            [ sys.maxsize if limit == None else limit for limit in limits ]
+
+        self.__timeout = timeout
+        self.__deadline = None
+        self.__clear_plans()
+
+        return self
+
+    def cache(self, capacity: int = 256) -> OptioParser:
+
+        if not isinstance(capacity, int) or isinstance(capacity, bool) or capacity < 0:
+            raise ValueError('Capacity ' + str(capacity) + ' is malformed.')
+
+        self.__plans = None if capacity == 0 else OrderedDict()
+        self.__capacity = capacity
+        self.__hits = 0
+        self.__misses = 0
+
+        return self
+
+    def cache_info(self) -> dict[str, int | float]:
+
+        if self.__plans == None:
+            return { 'hits': 0, 'misses': 0, 'size': 0, 'capacity': 0, 'hit_rate': 0.0 }
+
+        total = self.__hits + self.__misses
+
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'size': len(self.__plans),
+            'capacity': self.__capacity,
+            'hit_rate': 0.0 if total == 0 else self.__hits / total
+        }
+
+    def __clear_plans(self) -> None:
+        if self.__plans != None:
+            self.__plans.clear()
+
+    def result(self) -> OptioResult:
+        values = dict()
+
+        for opt in self.__found:
+            for view in opt.views():
+                values[view] = opt.value()
+
+        return OptioResult(values, list(self.__plain_args))
+
     def try_get_option(self, view: str) -> _Option | None:
         return self.__view2option.get(view, None)
 
@@ -199,90 +303,279 @@ class OptioParser:
             raise ValueError('Unknown view ' + view + '.')
         return opt
 
-    def __gather(self, args: list[str]) -> OptioParser:
-        args = deque(args)
+    def __check_deadline(self) -> None:
+        if self.__deadline != None and time.monotonic() > self.__deadline:
+            raise OptioLimitError('Parsing exceeded timeout of ' + str(self.__timeout) + ' seconds.')
+
+    def __check_params(self, params: int) -> None:
+        if params > self.__max_params:
+            raise OptioLimitError('Input exceeded limit of ' + str(self.__max_params) + ' parameters.')
+
+    def __measure(self, arg: str | bytes, length: int) -> int:
+
+        if not isinstance(arg, str) and not isinstance(arg, _BYTES_LIKE):
+            raise ValueError('Argument ' + str(arg) + ' is neither a string nor bytes-like.')
+
+        if self.__max_input_length == sys.maxsize:
+            return length
+
+        length += len(arg) if isinstance(arg, str) else memoryview(arg).nbytes
+
+        if length > self.__max_input_length:
+            raise OptioLimitError('Input exceeded limit of ' + str(self.__max_input_length) + ' characters.')
+
+        return length
+
+    def __split(self, arg: str, tokens: list[str]) -> None:
+
+        # an argument without white spaces is a token by itself and is not copied
+
+        if not (' ' in arg or '\t' in arg or '\n' in arg or '\r' in arg):
+            if arg:
+                if len(tokens) == self.__max_tokens:
+                    raise OptioLimitError('Input exceeded limit of ' + str(self.__max_tokens) + ' tokens.')
+
+                tokens.append(arg)
+
+        elif self.__max_tokens == sys.maxsize:
+            for token in _SPACES.split(arg):
+                if token:
+                    tokens.append(token)
+
+        else:
+
+            # with a limit, tokens are produced one by one so that the input is never split beyond it
+
+            for match in _TOKEN.finditer(arg):
+                if len(tokens) == self.__max_tokens:
+                    raise OptioLimitError('Input exceeded limit of ' + str(self.__max_tokens) + ' tokens.')
+
+                tokens.append(match.group())
+
+        self.__check_deadline()
+
+    def __split_bytes(self, arg: bytes, tokens: list[str | memoryview]) -> None:
+        data = memoryview(arg)
+
+        if not data.c_contiguous:
+            raise ValueError('Argument ' + str(arg) + ' is not a contiguous buffer.')
+
+        data = data.cast('B')
+
+        # slices of writable buffers are not hashable, views are then looked up by a copy
+
+        hashable = data.readonly
+
+        for match in _BYTES_TOKEN.finditer(data):
+            if len(tokens) == self.__max_tokens:
+                raise OptioLimitError('Input exceeded limit of ' + str(self.__max_tokens) + ' tokens.')
+
+            token = data[match.start():match.end()]
+
+            # tokens that may be views are turned into strings, parameters are kept as slices
+
+            if not self.__delimited and token[0] == 0x2d:
+                view = self.__encoded.get(token if hashable else bytes(token), None)
+                token = str(token, 'utf-8', 'surrogateescape') if view == None else view
+                self.__delimited = token == '--'
+
+            tokens.append(token)
+
+        self.__check_deadline()
+
+    def __tokenize(self, args: list[str | bytes] | str | bytes) -> list[str | memoryview]:
+        tokens = self.__tokens
+        tokens.clear()
+
+        if isinstance(args, str):
+            self.__measure(args, 0)
+            self.__split(args, tokens)
+
+        elif isinstance(args, _BYTES_LIKE):
+            self.__measure(args, 0)
+            self.__delimited = False
+            self.__split_bytes(args, tokens)
+
+        else:
+            length = 0
+
+            for arg in args:
+                length = self.__measure(arg, length)
+
+            self.__delimited = False
+
+            for arg in args:
+                if isinstance(arg, str):
+                    self.__split(arg, tokens)
+
+                else:
+                    self.__split_bytes(arg, tokens)
+
+        return tokens
+
+    def __resolve(self, arg: str, args: deque) -> _Option:
+
+        # configured views are well-formed, no need to inspect them
+
+        opt = self.__view2option.get(arg, None)
+
+        if opt != None:
+            return opt
+
+        if arg.startswith('--'):
+
+            if _Option.is_single_long_view(arg):
+                opt = self.__get_option(arg)
+
+            else:
+                view = ''
+                param = ''
+
+                if '=' in arg:
+                    pos = arg.find('=')
+                    view = arg[:pos]
+                    param = arg[pos + 1:]
+
+                if not _Option.is_single_long_view(view):
+                    raise ValueError('Malformed long view ' + view + '.')
+
+                # the parameter is pushed back only for a known view, peek skips unknown ones
+
+                opt = self.__get_option(view)
+
+                if len(param) > 0: args.appendleft(param)
+
+        else:
+            if arg == '-' or not arg[1].isalpha():
+                raise ValueError('Malformed argument ' + arg + '.')
+
+            if _Option.is_single_short_view(arg):
+                opt = self.__get_option(arg)
+
+            else:
+                view = arg[:2]
+                suffix = arg[2:]
+
+                if suffix.startswith('-'):
+                    raise ValueError('Malformed argument ' + arg + '.')
+
+                opt = self.__get_option(view)
+
+                if opt.is_flag():
+                    suffix = '-' + suffix
+
+                args.appendleft(suffix)
+
+        return opt
+
+    def __gather(self, tokens: list[str], pending: set[_Option] | None = None) -> OptioParser:
+        args = self.__args
+        args.clear()
+        args.extend(tokens)
 
         only_plain_args = False
+        params = 0
 
         while args:
+            self.__check_deadline()
             arg = args.popleft()
 
             if only_plain_args:
+                params += 1
+                self.__check_params(params)
                 self.__plain_args.append(arg)
 
             elif arg == '--':
+
+                # pending options cannot appear after delimiter
+
+                if pending != None:
+                    break
+
                 only_plain_args = True
 
-            else:
-                if arg.startswith('-'):
+            elif isinstance(arg, str) and arg.startswith('-'):
 
-                    opt = None
+                try:
+                    opt = self.__resolve(arg, args)
 
-                    if arg.startswith('--'):
+                except ValueError:
 
-                        if _Option.is_single_long_view(arg):
-                            opt = self.__get_option(arg)
+                    # partial parsing skips views it has not been asked for
 
-                        else:
-                            view = ''
-                            param = ''
+                    if pending == None:
+                        raise
 
-                            if '=' in arg:
-                                pos = arg.find('=')
-                                view = arg[:pos]
-                                param = arg[pos + 1:]
+                    continue
 
-                            if len(param) > 0: args.appendleft(param)
+                params = self.__gather_option(opt, args, params)
 
-                            if not _Option.is_single_long_view(view):
-                                raise ValueError('Malformed long view ' + view + '.')
+                if pending != None and opt in pending:
+                    pending.remove(opt)
 
-                            opt = self.__get_option(view)
+                    if not pending:
+                        break
 
-                    else:
-                        if arg == '-' or not arg[1].isalpha():
-                            raise ValueError('Malformed argument ' + arg + '.')
+            else:
+                params += 1
+                self.__check_params(params)
+                self.__plain_args.append(arg)
 
-                        if _Option.is_single_short_view(arg):
-                            opt = self.__get_option(arg)
+        return self
 
-                        else:
-                            view = arg[:2]
-                            suffix = arg[2:]
+    def __gather_option(self, opt: _Option, args: deque, params: int) -> int:
+        before = 0
 
-                            if suffix.startswith('-'):
-                                raise ValueError('Malformed argument ' + arg + '.')
+        if opt.is_found():
+            before = len(opt.value())
 
-                            opt = self.__get_option(view)
+        else:
+            self.__found.append(opt)
 
-                            if opt.is_flag():
-                                suffix = '-' + suffix
+        # the tighter of both limits stops gathering, parameters left behind are reported
 
-                            args.appendleft(suffix)
+        limit = self.__max_option_params
 
-                    opt.gather(args)
+        if self.__max_params != sys.maxsize:
+            limit = min(limit, before + self.__max_params - params)
+        after = len(opt.gather(args, limit).value())
 
-                else:
-                    self.__plain_args.append(arg)
+        if after == limit < opt.count()[1] and args and not (isinstance(args[0], str) and args[0].startswith('-')):
+            if limit == self.__max_option_params:
+                raise OptioLimitError(str(opt) + ' exceeded limit of ' + str(self.__max_option_params) + ' parameters.')
 
-        return self
+            self.__check_params(params + after - before + 1)
+
+        return params + after - before
+
+    def __check_options(self) -> None:
+
+        # options that are not found could violate only requirement
 
-    def __check(self) -> OptioParser:
-        for opt in self.__options:
+        for opt in self.__required:
+            if not opt.is_found():
+                opt.check()
+
+        for opt in self.__found:
             opt.check()
 
-        # TODO: improve conflict finding
+    def __check(self, conflicts: list[set[str]]) -> OptioParser:
+        self.__check_options()
+        return self.__check_conflicts(conflicts)
+
+    def __check_conflicts(self, conflicts: list[set[str]]) -> OptioParser:
 
-        for opt in self.__options:
-            for conflict in self.__conflicts:
-                for item in conflict:
-                    if opt.has(item[0]) and opt.is_found():
-                        item[1] = True
+        # conflict holds if every view belongs to some found option
 
-        for conflict in self.__conflicts:
+        for conflict in conflicts:
             result = True
-            for item in conflict:
-                result = result and item[1]
+
+            for view in conflict:
+                opt = self.try_get_option(view)
+
+                if opt == None or not opt.is_found():
+                    result = False
+                    break
 
             if result:
                 raise ValueError('Arguments are in conflict ' + str(conflict))
@@ -290,30 +583,176 @@ class OptioParser:
         return self
 
     def __accept(self) -> OptioParser:
-        for opt in self.__options:
+        for opt in self.__found:
             opt.accept()
 
         return self
 
-    def parse(self, args: list[str] | str, conflicts: list[set[str]] = []) -> OptioParser:
+    def __reset(self) -> None:
+
+        # only options found by the previous parse hold any state
 
-        for opt in self.__options:
+        for opt in self.__found:
             opt.reset()
 
+        self.__found.clear()
         self.__plain_args = []
 
-        if (isinstance(args, str)):
-            args = [ args ]
+    def __clear_scratch(self) -> None:
+
+        # tokens may be slices of the input, which is not kept beyond a parse
+
+        self.__tokens.clear()
+        self.__args.clear()
+
+    def __shape(self, tokens: list[str]) -> tuple | None:
+
+        # token kinds, values are None, tokens with attached values are (prefix, offset),
+        # any other token is kept as is, since its meaning depends on its content
+
+        shape = []
+        only_plain_args = False
+
+        for token in tokens:
+            kind = token
+
+            if only_plain_args or not isinstance(token, str) or not token.startswith('-'):
+                kind = None
+
+            elif token == '--':
+                only_plain_args = True
+
+            elif token.startswith('--'):
+                pos = token.find('=')
+
+                if pos >= 0 and len(token) > pos + 1 and token[pos + 1] != '-':
+                    kind = (token[:pos + 1], pos + 1)
+
+            elif len(token) > 2 and token[2] != '-':
+                opt = self.try_get_option(token[:2])
+
+                if opt != None and not opt.is_flag():
+                    kind = (token[:2], 2)
+
+            # tokens must not be confused with placeholders of values
+
+            if kind != None and '\0' in token:
+                return None
 
-        for arg in args:
-            if not isinstance(arg, str):
-                raise ValueError('Argument ' + arg + 'is not a string.')
+            shape.append(kind)
 
-        # split arguments with white spaces and flat list of lists
-        args = list(itertools.chain.from_iterable(list(map(lambda arg: [ w for w in re.split(r'[ \r\t\n]+', arg) if w != '' ], args))))
+        return tuple(shape)
 
-        for i in range(len(conflicts)):
-            conflicts[i] = [ [ c, False ] for c in conflicts[i] ]
-        self.__conflicts = conflicts
+    def __plan(self, shape: tuple) -> tuple:
+
+        # gather placeholders instead of values, so that the outcome depends only on shape
+
+        tokens = []
+        holders = dict()
+
+        for i, kind in enumerate(shape):
+            if kind == None or kind.__class__ is tuple:
+                holder = '\0' + str(i)
+                holders[holder] = (i, 0 if kind == None else kind[1])
+                tokens.append(holder if kind == None else kind[0] + holder)
+
+            else:
+                tokens.append(kind)
+
+        self.__gather(tokens)
+        self.__check_options()
+
+        found = [ (opt, [ holders.get(value, value) for value in opt.value() ]) for opt in self.__found ]
+        plain_args = [ holders.get(arg, arg) for arg in self.__plain_args ]
+
+        self.__reset()
+
+        return (found, plain_args)
+
+    def __replay(self, plan: tuple, tokens: list[str]) -> OptioParser:
+        found, plain_args = plan
+
+        for opt, values in found:
+            self.__found.append(opt)
+            opt.assign([ value if value.__class__ is str else tokens[value[0]][value[1]:] for value in values ])
+
+        self.__plain_args = [ arg if arg.__class__ is str else tokens[arg[0]][arg[1]:] for arg in plain_args ]
+
+        return self
+
+    def __lookup(self, shape: tuple) -> tuple:
+        plan = self.__plans.get(shape, None)
+
+        if plan != None:
+            self.__hits += 1
+            self.__plans.move_to_end(shape)
+            return plan
+
+        self.__misses += 1
+        plan = self.__plan(shape)
+        self.__plans[shape] = plan
+
+        if len(self.__plans) > self.__capacity:
+            self.__plans.popitem(last=False)
+
+        return plan
+
+    def parse(self, args: list[str] | str, conflicts: list[set[str]] = []) -> OptioParser:
+
+        self.__reset()
+
+        if self.__timeout != None:
+            self.__deadline = time.monotonic() + self.__timeout
+
+        try:
+            tokens = self.__tokenize(args)
+            shape = None if self.__plans == None else self.__shape(tokens)
+
+            if shape == None:
+                self.__gather(tokens)
+
+            else:
+
+                # repeated shape skips classification and routing, values are sliced into place
+
+                self.__replay(self.__lookup(shape), tokens)
+
+        finally:
+            self.__clear_scratch()
+
+        if shape == None:
+            return self.__check(conflicts).__accept()
+
+        return self.__check_conflicts(conflicts).__accept()
+
+    def peek(self, args: list[str] | str, views: set[str]) -> OptioParser:
+
+        options = set([ self.__get_option(view) for view in views ])
+        pending = set(options)
+
+        self.__reset()
+
+        if self.__timeout != None:
+            self.__deadline = time.monotonic() + self.__timeout
+
+        try:
+            tokens = self.__tokenize(args)
+
+            if pending:
+                self.__gather(tokens, pending)
+
+        finally:
+            self.__clear_scratch()
+
+        # options gathered on the way are not checked and accepted, hence not reported
+
+        for opt in self.__found:
+            if opt not in options:
+                opt.reset()
+
+        self.__found = [ opt for opt in self.__found if opt in options ]
+
+        for opt in options:
+            opt.check()
 
-        return self.__gather(args).__check().__accept()
+        return self.__accept()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+
+
+class OptioResult:
+
+    def __init__(self, values: dict[str, any] = {}, plain_args: list[str] = []) -> OptioResult:
+        self.__values = values
+        self.__plain_args = plain_args
+
+    def __str__(self) -> str:
+        return 'Result ' + str(self.__values) + ' ' + str(self.__plain_args)
+
+    def value(self, view: str) -> any:
+        return self.__values.get(view, None)
+
+    def is_found(self, view: str) -> bool:
+        return view in self.__values
+
+    def values(self) -> dict[str, any]:
+        return self.__values
+
+    def plain_args(self) -> list[str]:
+        return self.__plain_args
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+import importlib
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+from .client import _decode, _encode
+from .parser import OptioParser
+
+
+def _is_socket(path: str) -> bool:
+
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+
+    except FileNotFoundError:
+        return False
+
+
+class _OptioHandler(socketserver.StreamRequestHandler):
+
+    def handle(self) -> None:
+
+        # one connection serves any number of requests, one request per line
+
+        for line in self.rfile:
+            self.wfile.write(self.server.answer(line))
+            self.wfile.flush()
+
+
+class OptioServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+    def __init__(self, path: str, parsers: dict[str, OptioParser]) -> OptioServer:
+
+        for name, parser in parsers.items():
+            if not isinstance(parser, OptioParser):
+                raise ValueError('Parser ' + str(name) + ' is not an OptioParser.')
+
+        self.__path = path
+        self.__parsers = parsers
+
+        # parsers keep the state of the last parse, hence requests are serialized
+
+        self.__lock = threading.Lock()
+
+        # a stale socket of a previous daemon is replaced, anything else is kept
+
+        if os.path.lexists(path):
+            if not _is_socket(path):
+                raise ValueError('Path ' + str(path) + ' exists and is not a socket.')
+
+            os.unlink(path)
+
+        super().__init__(path, _OptioHandler)
+
+    def answer(self, line: bytes) -> bytes:
+
+        try:
+            request = _decode(line)
+            parser = self.__parsers.get(request['parser'], None)
+
+            if parser == None:
+                raise ValueError('Unknown parser ' + str(request['parser']) + '.')
+
+            conflicts = [ set(conflict) for conflict in request.get('conflicts', []) ]
+
+            with self.__lock:
+                result = parser.parse(request['args'], conflicts).result()
+
+                # acceptors may return arbitrary objects, only JSON-like values are transferable
+
+                return _encode({ 'values': result.values(), 'plain_args': result.plain_args() })
+
+        except Exception as error:
+            name = 'ValueError' if isinstance(error, json.JSONDecodeError) else type(error).__name__
+            return _encode({ 'error': name, 'message': str(error) })
+
+    def server_close(self) -> None:
+        super().server_close()
+
+        if _is_socket(self.__path):
+            os.unlink(self.__path)
+
+
+def _load(spec: str) -> tuple[str, OptioParser]:
+
+    # spec has the form name=module:attribute
+
+    name, _, target = spec.partition('=')
+    module, _, attribute = target.partition(':')
+
+    if not name or not module or not attribute:
+        raise ValueError('Malformed parser spec ' + spec + '.')
+
+    return name, getattr(importlib.import_module(module), attribute)
+
+
+def main(argv: list[str]) -> None:
+
+    if len(argv) < 2:
+        print('usage: python3 -m optio.server <socket> <name>=<module>:<attribute> ...', file=sys.stderr)
+        sys.exit(2)
+
+    with OptioServer(argv[0], dict(map(_load, argv[1:]))) as server:
+        try:
+            server.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+
+import unittest
+from optio import *
+
+
+def is_positive(value: int) -> bool:
+    return value > 0
+
+
+class TestsOptioPipelineCompose(unittest.TestCase):
+
+    def test_Str(self):
+        pipeline = convert(str.strip) | convert(int) | check(is_positive) | unique() | collect(tuple)
+        self.assertEqual(str(pipeline), 'convert(strip) | convert(int) | check(is_positive) | unique() | collect(tuple)')
+
+    def test_Steps(self):
+        self.assertEqual(len((convert(int) | check(is_positive)).steps()), 2)
+
+    def test_ReuseAcrossPipelines(self):
+        ints = convert(int) | check(is_positive)
+        first, second = ints | unique(), ints | collect(sum)
+        self.assertEqual(len(ints.steps()), 2)
+        self.assertListEqual(first(['1', '1']), [1])
+        self.assertEqual(second(['1', '1']), 2)
+
+    def test_StepAfterCollect(self):
+        with self.assertRaises(ValueError):
+            collect(tuple) | unique()
+
+    def test_NonCallableStep(self):
+        with self.assertRaises(ValueError):
+            convert(None)
+
+    def test_NonPipelineOperand(self):
+        with self.assertRaises(TypeError):
+            convert(int) | int
+
+class TestsOptioPipelineCall(unittest.TestCase):
+
+    def test_EmptyPipeline(self):
+        self.assertListEqual(OptioPipeline()(['1']), ['1'])
+
+    def test_NotFoundParameters(self):
+        self.assertIsNone((convert(int) | collect(tuple))(None))
+
+    def test_Convert(self):
+        self.assertListEqual(convert(int)(['1', '2']), [1, 2])
+
+    def test_CheckFail(self):
+        with self.assertRaises(ValueError):
+            (convert(int) | check(is_positive))(['1', '0'])
+
+    def test_CheckFailMessage(self):
+        with self.assertRaisesRegex(ValueError, 'Parameter 0 rejected by is_positive'):
+            (convert(int) | unique() | check(is_positive))(['1', '1', '0'])
+
+    def test_UniqueKeepsOrder(self):
+        self.assertListEqual((convert(int) | unique())(['3', '1', '03', '1']), [3, 1])
+
+    def test_SeveralUniques(self):
+        pipeline = unique() | convert(str.lower) | unique()
+        self.assertListEqual(pipeline(['a', 'A', 'a', 'b']), ['a', 'b'])
+
+    def test_UniqueBetweenCalls(self):
+        pipeline = unique()
+        self.assertListEqual(pipeline(['a']), ['a'])
+        self.assertListEqual(pipeline(['a']), ['a'])
+
+    def test_CheckAfterUnique(self):
+        self.assertListEqual((unique() | check(str.isdigit))(['1', '1']), ['1'])
+
+class TestsOptioPipelineAcceptor(unittest.TestCase):
+
+    def test_AsAcceptor(self):
+        value = OptioParser()\
+            .add_option({'-c'}, convert(int) | check(is_positive) | unique())\
+            .parse('-c 1 2 1')\
+            .try_get_option('-c')\
+            .value()
+        self.assertListEqual(value, [1, 2])
+
+class TestsOptioPipelineDecode(unittest.TestCase):
+
+    def test_DecodeBytesLike(self):
+        self.assertListEqual(decode()([ memoryview(b'a'), b'b', bytearray(b'c') ]), ['a', 'b', 'c'])
+
+    def test_DecodeString(self):
+        self.assertListEqual(decode()(['a']), ['a'])
+
+    def test_DecodeErrors(self):
+        self.assertListEqual(decode('ascii', 'replace')([ b'\xff' ]), ['�'])
+
+    def test_Str(self):
+        self.assertEqual(str(decode() | convert(int)), 'convert(decode) | convert(int)')
+
+class TestsOptioPipelineExports(unittest.TestCase):
+
+    def test_OnlyPipelineNamesExported(self):
+        import optio, optio.acceptor
+        self.assertListEqual(sorted(optio.acceptor.__all__), ['OptioPipeline', 'check', 'collect', 'convert', 'decode', 'unique'])
+        for name in optio.acceptor.__all__:
+            self.assertIs(getattr(optio, name), getattr(optio.acceptor, name))
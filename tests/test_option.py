@@ -153,6 +153,12 @@ class TestOptionGather(unittest.TestCase):
         self.assertListEqual(o.value(), ['1'])
         self.assertListEqual(list(d), ['-2', '3'])
     
+    def test_Limit(self):
+        d = deque(['1', '2', '3'])
+        o = _Option({'-a'}).gather(d, 2)
+        self.assertListEqual(o.value(), ['1', '2'])
+        self.assertListEqual(list(d), ['3'])
+
     def test_SeveralCalls(self):
         self.assertListEqual(_Option({'-a'}).gather(deque(['1'])).gather(deque(['2'])).value(), ['1', '2'])
 
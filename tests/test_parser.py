@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 
+import tracemalloc
 import unittest
 from optio import *
 
@@ -20,6 +21,13 @@ def accept_txt_files(params: list[str]) -> None:
     return params
 
 
+def make_parser(accept_count=accept_ints) -> OptioParser:
+    return OptioParser()\
+        .add_option({'-c'}, accept_count, count=(1, 1))\
+        .add_option({'-f', '--file'})\
+        .add_option({'-v'}, count=(0, 0), required=False)
+
+
 class TestsOptioParserOptions(unittest.TestCase):
 
     def test_Default(self):
@@ -256,3 +264,379 @@ class TestsOptioParserParse(unittest.TestCase):
                 .add_option({'-a', '-b'}, count=(0, 0))\
                 .add_option({'-c', '-d'}, count=(0, 0))\
                 .parse(args=['-a', '-c'], conflicts=[{'-b', '-d'}])
+
+class TestsOptioParserResult(unittest.TestCase):
+
+    def test_ResultBySynonym(self):
+        result = OptioParser()\
+            .add_option({'-a', '--all'}, accept_ints)\
+            .parse('-a 1')\
+            .result()
+        self.assertListEqual(result.value('--all'), [1])
+
+    def test_ResultNotFound(self):
+        result = OptioParser()\
+            .add_option({'-a'}, required=False)\
+            .parse('x')\
+            .result()
+        self.assertFalse(result.is_found('-a'))
+        self.assertListEqual(result.plain_args(), ['x'])
+
+    def test_ResultDetachedFromParser(self):
+        parser = OptioParser().add_option({'-a'}, count=(0, 0), required=False)
+        result = parser.parse('-a').result()
+        parser.parse('')
+        self.assertTrue(result.is_found('-a'))
+
+    def test_ResultValues(self):
+        result = OptioParser()\
+            .add_option({'-a', '--all'}, accept_ints)\
+            .add_option({'-b'}, required=False)\
+            .parse('-a 1')\
+            .result()
+        self.assertDictEqual(result.values(), { '-a': [1], '--all': [1] })
+
+class TestsOptioParserLimit(unittest.TestCase):
+
+    def test_MalformedLimit(self):
+        for limit in [ -1, '1', 1.5, True ]:
+            with self.subTest(limit=limit):
+                with self.assertRaises(ValueError):
+                    OptioParser().limit(tokens=limit)
+
+    def test_MalformedTimeout(self):
+        for timeout in [ 0, -1, '1' ]:
+            with self.subTest(timeout=timeout):
+                with self.assertRaises(ValueError):
+                    OptioParser().limit(timeout=timeout)
+
+    def test_InputLength(self):
+        with self.assertRaises(OptioLimitError):
+            OptioParser().limit(input_length=4).parse(['ab', 'cde'])
+
+    def test_InputLengthWithin(self):
+        self.assertListEqual(OptioParser().limit(input_length=5).parse(['ab', 'cde']).plain_args(), ['ab', 'cde'])
+
+    def test_Tokens(self):
+        with self.assertRaises(OptioLimitError):
+            OptioParser().limit(tokens=2).parse(' a  b c ')
+
+    def test_TokensWithin(self):
+        self.assertListEqual(OptioParser().limit(tokens=3).parse([' a  b', 'c ']).plain_args(), ['a', 'b', 'c'])
+
+    def test_OptionParams(self):
+        with self.assertRaises(OptioLimitError):
+            OptioParser()\
+                .add_option({'-a'})\
+                .limit(option_params=2)\
+                .parse('-a 1 2 3')
+
+    def test_OptionParamsRepeatedOption(self):
+        with self.assertRaises(OptioLimitError):
+            OptioParser()\
+                .add_option({'-a'})\
+                .limit(option_params=2)\
+                .parse('-a 1 -a 2 -a 3')
+
+    def test_OptionParamsWithin(self):
+        value = OptioParser()\
+            .add_option({'-a'}, count=(1, 2))\
+            .limit(option_params=2)\
+            .parse('-a 1 2 3')\
+            .try_get_option('-a')\
+            .value()
+        self.assertListEqual(value, ['1', '2'])
+
+    def test_Params(self):
+        with self.assertRaises(OptioLimitError):
+            OptioParser()\
+                .add_option({'-a'})\
+                .add_option({'-b'})\
+                .limit(params=3)\
+                .parse('-a 1 2 -b 3 4')
+
+    def test_ParamsWithPlainArgs(self):
+        with self.assertRaises(OptioLimitError):
+            OptioParser()\
+                .add_option({'-a'}, count=(1, 1))\
+                .limit(params=2)\
+                .parse('-a 1 x -- y')
+
+    def test_ParamsWithin(self):
+        parser = OptioParser()\
+            .add_option({'-a'}, count=(1, 1))\
+            .limit(params=3)\
+            .parse('-a 1 x -- y')
+        self.assertListEqual(parser.plain_args(), ['x', 'y'])
+
+    def test_Timeout(self):
+        with self.assertRaises(OptioLimitError):
+            OptioParser().limit(timeout=1e-9).parse(' '.join(['x'] * 10000))
+
+    def test_LimitIsRuntimeError(self):
+        with self.assertRaises(RuntimeError):
+            OptioParser().limit(tokens=0).parse('x')
+
+    def test_ConflictsNotModified(self):
+        conflicts = [{'-a', '-b'}]
+        OptioParser()\
+            .add_option({'-a'}, count=(0, 0))\
+            .add_option({'-b'}, count=(0, 0), required=False)\
+            .parse('-a', conflicts)
+        self.assertListEqual(conflicts, [{'-a', '-b'}])
+
+class TestsOptioParserPeek(unittest.TestCase):
+
+    def parser(self):
+        return OptioParser()\
+            .add_option({'-h', '--help'}, count=(0, 0), required=False)\
+            .add_option({'--config'}, count=(1, 1), required=False)\
+            .add_option({'-n'}, accept_ints)
+
+    def test_PeekValue(self):
+        value = self.parser()\
+            .peek('-n 1 --config=app.cfg', {'--config'})\
+            .try_get_option('--config')\
+            .value()
+        self.assertListEqual(value, ['app.cfg'])
+
+    def test_PeekSkipsRequired(self):
+        self.assertTrue(self.parser().peek('-h', {'-h'}).try_get_option('-h').is_found())
+
+    def test_PeekRunsOnlyRequestedAcceptors(self):
+        parser = self.parser().peek('-n x -h', {'--help'})
+        self.assertTrue(parser.try_get_option('-h').is_found())
+        self.assertFalse(parser.try_get_option('-n').is_found())
+
+    def test_PeekStopsEarly(self):
+        parser = self.parser().peek('--config 1.cfg -n 1 -u', {'--config'})
+        self.assertFalse(parser.try_get_option('-n').is_found())
+
+    def test_PeekSkipsUnknownViews(self):
+        parser = self.parser().peek('-u 1 --unknown=2 -1 --help', {'-h'})
+        self.assertTrue(parser.try_get_option('-h').is_found())
+
+    def test_PeekSkipsUnknownLongViewValue(self):
+        self.assertFalse(self.parser().peek('--x=-h', {'-h'}).try_get_option('-h').is_found())
+
+    def test_PeekSkipsUnknownLongViewParam(self):
+        parser = self.parser().peek('--x=1 -h', {'-h'})
+        self.assertTrue(parser.try_get_option('-h').is_found())
+        self.assertListEqual(parser.plain_args(), [])
+
+    def test_PeekNotFound(self):
+        self.assertFalse(self.parser().peek('-n 1 -- -h', {'-h'}).try_get_option('-h').is_found())
+
+    def test_PeekChecksRequested(self):
+        with self.assertRaises(RuntimeError):
+            self.parser().peek('--config', {'--config'})
+
+    def test_PeekUnknownRequestedView(self):
+        with self.assertRaises(ValueError):
+            self.parser().peek('-h', {'-u'})
+
+    def test_PeekResetsPreviousParse(self):
+        parser = self.parser().parse('-n 1')
+        self.assertFalse(parser.peek('-h', {'-h'}).try_get_option('-n').is_found())
+
+    def test_PeekNothing(self):
+        self.assertListEqual(self.parser().peek('x', set()).plain_args(), [])
+
+class TestsOptioParserCache(unittest.TestCase):
+
+    def test_MalformedCapacity(self):
+        for capacity in [ -1, '1', None ]:
+            with self.subTest(capacity=capacity):
+                with self.assertRaises(ValueError):
+                    OptioParser().cache(capacity)
+
+    def test_Disabled(self):
+        parser = OptioParser().add_option({'-a'}).parse('-a 1').parse('-a 2')
+        self.assertEqual(parser.cache_info()['size'], 0)
+
+    def test_HitWithDifferentValues(self):
+        parser = make_parser().cache(2)
+        parser.parse('-c 1 --file a b x')
+        parser.parse('-c 2 --file c d -- y')
+        parser.parse('-c 3 --file e f -- z')
+        self.assertListEqual(parser.try_get_option('-c').value(), [3])
+        self.assertListEqual(parser.try_get_option('-f').value(), ['e', 'f'])
+        self.assertListEqual(parser.plain_args(), ['z'])
+        self.assertEqual(parser.cache_info()['hits'], 1)
+
+    def test_HitWithAttachedValues(self):
+        parser = make_parser().cache(2)
+        parser.parse('-c1 --file=a -v')
+        parser.parse('-c2 --file=b -v')
+        self.assertListEqual(parser.try_get_option('-c').value(), [2])
+        self.assertListEqual(parser.try_get_option('-f').value(), ['b'])
+        self.assertTrue(parser.try_get_option('-v').is_found())
+        self.assertEqual(parser.cache_info()['hits'], 1)
+
+    def test_MissWithDifferentViews(self):
+        parser = make_parser().cache(2)
+        parser.parse('-c 1 -f a')
+        parser.parse('-c 1 --file a')
+        self.assertEqual(parser.cache_info()['misses'], 2)
+
+    def test_HitRate(self):
+        parser = make_parser().cache(2)
+        for i in range(4):
+            parser.parse('-c ' + str(i) + ' -f a')
+        self.assertEqual(parser.cache_info()['hit_rate'], 0.75)
+
+    def test_Bounded(self):
+        parser = make_parser().cache(2)
+        parser.parse('-c 1 -f a')
+        parser.parse('-c 1 -f a b')
+        parser.parse('-c 1 -f a b c')
+        parser.parse('-c 1 -f a')
+        self.assertEqual(parser.cache_info()['size'], 2)
+        self.assertEqual(parser.cache_info()['misses'], 4)
+
+    def test_ErrorOnHitShape(self):
+        parser = make_parser().cache(2)
+        parser.parse('-c 1 -f a')
+        with self.assertRaises(ValueError):
+            parser.parse('-c x -f a')
+
+    def test_ErrorNotCached(self):
+        parser = make_parser().cache(2)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                parser.parse('-f a')
+        self.assertEqual(parser.cache_info()['size'], 0)
+
+    def test_ConflictsOnHit(self):
+        parser = make_parser().cache(2)
+        parser.parse('-c 1 -f a -v')
+        with self.assertRaises(ValueError):
+            parser.parse('-c 1 -f a -v', conflicts=[{'-c', '-v'}])
+
+    def test_ClearedByAddOption(self):
+        parser = make_parser().cache(2)
+        parser.parse('-c 1 -f a')
+        self.assertEqual(parser.add_option({'-x'}, required=False).cache_info()['size'], 0)
+
+class TestsOptioParserSparse(unittest.TestCase):
+
+    def test_AcceptorNotCalledForNotFound(self):
+        value = OptioParser()\
+            .add_option({'-a'}, accept_ints, required=False)\
+            .parse('')\
+            .try_get_option('-a')\
+            .value()
+        self.assertIsNone(value)
+
+    def test_RequiredAmongMany(self):
+        parser = OptioParser()
+        for i in range(100):
+            parser.add_option({'--o' + str(i)}, required=(i == 42))
+        with self.assertRaises(RuntimeError):
+            parser.parse('--o1 x')
+
+    def test_ResetOnlyFound(self):
+        parser = OptioParser()\
+            .add_option({'-a'}, required=False)\
+            .add_option({'-b'}, required=False)
+        parser.parse('-a 1')
+        parser.parse('-b 2')
+        self.assertIsNone(parser.try_get_option('-a').value())
+        self.assertListEqual(parser.try_get_option('-b').value(), ['2'])
+
+    def test_CountCheckedForFound(self):
+        with self.assertRaises(RuntimeError):
+            OptioParser()\
+                .add_option({'-a'}, count=(2, 2), required=False)\
+                .parse('-a 1')
+
+class TestsOptioParserAllocations(unittest.TestCase):
+
+    def test_PeakPerParse(self):
+        parser = OptioParser()\
+            .add_option({'-c'}, count=(1, 1))\
+            .add_option({'-f', '--file'})\
+            .add_option({'-v'}, count=(0, 0), required=False)
+        args = [ '-c', '1', '--file', '1.txt', '2.txt', '-v', '--', 'x' ]
+        parser.parse(args)
+
+        tracemalloc.start()
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        parser.parse(args)
+        peak = tracemalloc.get_traced_memory()[1] - current
+        tracemalloc.stop()
+
+        self.assertLess(peak, 512)
+
+class TestsOptioParserBytes(unittest.TestCase):
+
+    def test_NulSeparated(self):
+        parser = make_parser(decode() | convert(int)).parse(b'-c\x001\x00--file\x00a.txt\x00b.txt\x00')
+        self.assertListEqual(parser.try_get_option('-c').value(), [1])
+        self.assertListEqual([ bytes(f) for f in parser.try_get_option('-f').value() ], [b'a.txt', b'b.txt'])
+
+    def test_WhiteSpaceSeparated(self):
+        parser = make_parser(decode() | convert(int)).parse(bytearray(b' -c 1\t-f a \n -v '))
+        self.assertTrue(parser.try_get_option('-v').is_found())
+        self.assertEqual(bytes(parser.try_get_option('-f').value()[0]), b'a')
+
+    def test_MemoryView(self):
+        parser = make_parser(decode() | convert(int)).parse(memoryview(b'-c 1 -f a'))
+        self.assertListEqual(parser.try_get_option('-c').value(), [1])
+
+    def test_ParametersAreSlices(self):
+        data = b'-c 1 -f a -- b'
+        parser = make_parser(decode() | convert(int)).parse(data)
+        self.assertIsInstance(parser.try_get_option('-f').value()[0], memoryview)
+        self.assertIs(parser.try_get_option('-f').value()[0].obj, data)
+        self.assertIsInstance(parser.plain_args()[0], memoryview)
+
+    def test_AttachedParameters(self):
+        parser = make_parser(decode() | convert(int)).parse(b'-c1 --file=a')
+        self.assertListEqual(parser.try_get_option('-c').value(), [1])
+        self.assertListEqual(parser.try_get_option('-f').value(), ['a'])
+
+    def test_AfterDelimiter(self):
+        parser = make_parser(decode() | convert(int)).parse(b'-c 1 -f a -- -v')
+        self.assertFalse(parser.try_get_option('-v').is_found())
+        self.assertEqual(bytes(parser.plain_args()[0]), b'-v')
+
+    def test_UnknownView(self):
+        with self.assertRaises(ValueError):
+            make_parser(decode() | convert(int)).parse(b'-c 1 -f a -u')
+
+    def test_ListOfBytes(self):
+        parser = make_parser(decode() | convert(int)).parse([ b'-c', b'1', b'-f', b'a b' ])
+        self.assertEqual(len(parser.try_get_option('-f').value()), 2)
+
+    def test_NonBytesLike(self):
+        with self.assertRaises(ValueError):
+            make_parser(decode() | convert(int)).parse([ b'-c', 1 ])
+
+    def test_NonContiguous(self):
+        with self.assertRaises(ValueError):
+            make_parser(decode() | convert(int)).parse(memoryview(b'-c 1 -f a ')[::2])
+
+    def test_ResizableAfterNextParse(self):
+        parser = make_parser(decode() | convert(int))
+        for cached in [ False, True ]:
+            with self.subTest(cached=cached):
+                if cached:
+                    parser.cache()
+                data = bytearray(b'-c 1 -f a')
+                parser.parse(data).parse(b'-c 1 -f a')
+                data.extend(b' b')
+                parser.peek(data, {'-v'})
+                data.extend(b' c')
+
+    def test_LengthLimitInBytes(self):
+        with self.assertRaises(OptioLimitError):
+            make_parser(decode() | convert(int)).limit(input_length=4).parse(memoryview('-c é'.encode('utf-8')))
+
+    def test_WithCache(self):
+        parser = make_parser(decode() | convert(int)).cache()
+        parser.parse(b'-c 1 -f a')
+        parser.parse(b'-c 2 -f b')
+        self.assertListEqual(parser.try_get_option('-c').value(), [2])
+        self.assertEqual(parser.cache_info()['hits'], 1)
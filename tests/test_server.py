@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from optio import *
+
+
+def accept_ints(params: list[str]) -> list[int]:
+    return [ int(p) for p in params ]
+
+
+def accept_object(_: list[str]) -> object:
+    return object()
+
+
+def make_parser(_: str = '') -> OptioParser:
+    return OptioParser()\
+        .add_option({'-c', '--copy'}, accept_ints)\
+        .add_option({'-v'}, count=(0, 0), required=False)
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix domain sockets are not available.')
+class TestsOptioServer(unittest.TestCase):
+
+    def setUp(self):
+        from optio.server import OptioServer
+
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'optio.sock')
+        self.server = OptioServer(self.path, {
+            'copy': make_parser(),
+            'object': OptioParser().add_option({'-o'}, accept_object),
+            'limited': make_parser().limit(tokens=2)
+        })
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,))
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.folder.cleanup()
+
+    def client(self):
+        from optio.client import OptioClient
+        return OptioClient(self.path)
+
+    def test_ParseValues(self):
+        client = self.client()
+        result = client.parse('copy', ' -c 1 2 -- x ')
+        client.close()
+        self.assertListEqual(result.value('--copy'), [1, 2])
+        self.assertListEqual(result.plain_args(), ['x'])
+
+    def test_NotFoundOption(self):
+        client = self.client()
+        result = client.parse('copy', ['-c', '1'])
+        client.close()
+        self.assertFalse(result.is_found('-v'))
+        self.assertIsNone(result.value('-v'))
+
+    def test_SeveralRequests(self):
+        client = self.client()
+        self.assertTrue(client.parse('copy', '-v -c 1').is_found('-v'))
+        self.assertFalse(client.parse('copy', '-c 1').is_found('-v'))
+        client.close()
+
+    def test_RequiredOptionError(self):
+        client = self.client()
+        with self.assertRaises(RuntimeError):
+            client.parse('copy', '-v')
+        client.close()
+
+    def test_UnknownViewError(self):
+        client = self.client()
+        with self.assertRaises(ValueError):
+            client.parse('copy', '-c 1 -u')
+        client.close()
+
+    def test_ConflictError(self):
+        client = self.client()
+        with self.assertRaises(ValueError):
+            client.parse('copy', '-c 1 -v', conflicts=[{'-c', '-v'}])
+        client.close()
+
+    def test_UnknownParser(self):
+        client = self.client()
+        with self.assertRaises(ValueError):
+            client.parse('unknown', '-c 1')
+        client.close()
+
+    def test_AnswerEncoded(self):
+        answer = self.server.answer(b'{"parser":"copy","args":"-c 1"}\n')
+        self.assertTrue(answer.endswith(b'\n'))
+        self.assertDictEqual(json.loads(answer), { 'values': { '-c': [1], '--copy': [1] }, 'plain_args': [] })
+
+    def test_NonSerializableValue(self):
+        client = self.client()
+        with self.assertRaises(TypeError):
+            client.parse('object', '-o 1')
+        client.close()
+
+    def test_OtherErrorAsRuntimeError(self):
+        client = self.client()
+        with self.assertRaises(RuntimeError) as context:
+            client.parse('limited', '-c 1 2 3')
+        client.close()
+        self.assertNotIsInstance(context.exception, OptioLimitError)
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix domain sockets are not available.')
+class TestsOptioClientFallback(unittest.TestCase):
+
+    def test_WithoutDaemon(self):
+        from optio.client import OptioClient
+
+        with tempfile.TemporaryDirectory() as folder:
+            with self.assertRaises(OSError):
+                OptioClient(os.path.join(folder, 'optio.sock')).parse('copy', '-c 1')
+
+    def test_FallbackWithoutDaemon(self):
+        from optio.client import OptioClient
+
+        with tempfile.TemporaryDirectory() as folder:
+            result = OptioClient(os.path.join(folder, 'optio.sock'), make_parser).parse('copy', '-c 1 -v')
+        self.assertListEqual(result.value('-c'), [1])
+        self.assertTrue(result.is_found('-v'))
+
+    def test_ImportWithoutParser(self):
+        code = 'import sys, optio.client; print(\'optio.parser\' in sys.modules)'
+        output = subprocess.run([ sys.executable, '-c', code ], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'False')
+
+    def test_BytesRejected(self):
+        from optio.client import OptioClient
+
+        with tempfile.TemporaryDirectory() as folder:
+            client = OptioClient(os.path.join(folder, 'optio.sock'), make_parser)
+            for args in [ b'-c 1', [ '-c', b'1' ], memoryview(b'-c 1') ]:
+                with self.subTest(args=args):
+                    with self.assertRaises(ValueError):
+                        client.parse('copy', args)
+
+    def test_NonCallableFallback(self):
+        from optio.client import OptioClient
+
+        with self.assertRaises(ValueError):
+            OptioClient('optio.sock', fallback=42)
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix domain sockets are not available.')
+class TestsOptioServerPath(unittest.TestCase):
+
+    def test_RegularFileKept(self):
+        from optio.server import OptioServer
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'optio.sock')
+
+            with open(path, 'w') as file:
+                file.write('data')
+
+            with self.assertRaises(ValueError):
+                OptioServer(path, { 'copy': make_parser() })
+
+            self.assertTrue(os.path.isfile(path))
+
+    def test_StaleSocketReplaced(self):
+        from optio.server import OptioServer
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'optio.sock')
+            stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale.bind(path)
+            stale.close()
+
+            OptioServer(path, { 'copy': make_parser() }).server_close()
+            self.assertFalse(os.path.exists(path))
+
+    def test_CloseKeepsReplacedPath(self):
+        from optio.server import OptioServer
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'optio.sock')
+            server = OptioServer(path, { 'copy': make_parser() })
+            os.unlink(path)
+
+            with open(path, 'w') as file:
+                file.write('data')
+
+            server.server_close()
+            self.assertTrue(os.path.isfile(path))